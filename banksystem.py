@@ -2,12 +2,53 @@
 # |                SISTEMA BANCÁRIO - VERSÃO ORIENTADA A OBJETOS             | #
 # ============================================================================ #
 
+import sys
+from array import array
+from typing import Final
+
+# --- MENSAGENS ---
+# Mensagens fixas exibidas ao usuário, reunidas em um só lugar.
+# A linha em branco que antecede cada mensagem é escrita por `exibir_mensagem()`.
+MSG_SALDO_INSUFICIENTE: Final[str] = "@@@ Operação falhou! Saldo insuficiente. @@@"
+MSG_VALOR_INVALIDO: Final[str] = "@@@ Operação falhou! O valor informado é inválido. @@@"
+MSG_SAQUES_EXCEDIDOS: Final[str] = "@@@ Operação falhou! Número máximo de saques excedido. @@@"
+MSG_SAQUE_OK: Final[str] = "=== Saque realizado com sucesso! ==="
+MSG_DEPOSITO_OK: Final[str] = "=== Depósito realizado com sucesso! ==="
+MSG_CLIENTE_SEM_CONTA: Final[str] = "@@@ Cliente não possui conta! @@@"
+MSG_CLIENTE_NAO_ENCONTRADO: Final[str] = "@@@ Cliente não encontrado! @@@"
+MSG_ENTRADA_INVALIDA: Final[str] = "@@@ Valor inválido! Por favor, informe um número. @@@"
+MSG_CPF_EXISTENTE: Final[str] = "@@@ Já existe um cliente com esse CPF! @@@"
+MSG_CLIENTE_CRIADO: Final[str] = "=== Cliente criado com sucesso! ==="
+MSG_CONTA_NAO_CRIADA: Final[str] = "@@@ Cliente não encontrado, criação de conta encerrada! @@@"
+MSG_CONTA_CRIADA: Final[str] = "=== Conta criada com sucesso! ==="
+MSG_SEM_CONTAS: Final[str] = "@@@ Nenhuma conta cadastrada. @@@"
+MSG_ENCERRAMENTO: Final[str] = "Obrigado por utilizar nosso sistema. Até logo!\n"
+MSG_OPERACAO_INVALIDA: Final[str] = "@@@ Operação inválida, por favor selecione novamente a operação desejada. @@@"
+
+
+def exibir_mensagem(mensagem):
+    """Exibe uma mensagem ao usuário precedida de uma linha em branco."""
+    sys.stdout.write(f"\n{mensagem}\n")
+
 # --- CLASSES DE TRANSAÇÃO ---
 # Define a estrutura base para todas as transações (Saque, Depósito, etc.).
 # Funciona como um "contrato" que obriga as classes filhas a implementarem
 # certos métodos e propriedades para garantir um comportamento consistente.
 class Transacao:
     """Classe base para todas as transações do sistema."""
+    # `__slots__` fixa os atributos das instâncias, dispensando o `__dict__`
+    # de cada objeto e economizando memória.
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Garante que toda subclasse tenha o atributo de classe `_TIPO` (nome
+        exibido no extrato). Se a subclasse não o declarar, usa o nome da classe.
+        """
+        super().__init_subclass__(**kwargs)
+        if "_TIPO" not in cls.__dict__:
+            cls._TIPO = cls.__name__
+
     @property
     def valor(self):
         """Propriedade que deve retornar o valor da transação."""
@@ -21,6 +62,9 @@ class Transacao:
 
 class Saque(Transacao):
     """Representa a transação de saque."""
+    __slots__ = ("_valor",)
+    _TIPO = "Saque"  # Nome da transação exibido no extrato.
+
     def __init__(self, valor):
         self._valor = valor  # Atributo que armazena o valor a ser sacado.
 
@@ -34,11 +78,14 @@ class Saque(Transacao):
         Executa a lógica de saque na conta fornecida e, se for bem-sucedido,
         adiciona esta transação ao histórico da conta.
         """
-        if conta.sacar(self.valor):
-            conta.historico.adicionar_transacao(self)
+        if conta.sacar(self._valor):
+            conta._historico.adicionar_transacao(self)
 
 class Deposito(Transacao):
     """Representa a transação de depósito."""
+    __slots__ = ("_valor",)
+    _TIPO = "Deposito"  # Nome da transação exibido no extrato.
+
     def __init__(self, valor):
         self._valor = valor  # Atributo que armazena o valor a ser depositado.
 
@@ -52,8 +99,8 @@ class Deposito(Transacao):
         Executa a lógica de depósito na conta fornecida e, se for bem-sucedido,
         adiciona esta transação ao histórico da conta.
         """
-        if conta.depositar(self.valor):
-            conta.historico.adicionar_transacao(self)
+        if conta.depositar(self._valor):
+            conta._historico.adicionar_transacao(self)
 
 
 # --- CLASSE DE HISTÓRICO ---
@@ -62,31 +109,43 @@ class Historico:
     Responsável por manter uma lista de todas as transações
     realizadas em uma conta.
     """
+    __slots__ = ("_tipos", "_valores")
+
     def __init__(self):
-        # A lista `_transacoes` armazena um dicionário para cada transação.
-        self._transacoes = []
+        # As transações são guardadas em duas sequências paralelas: `_tipos`
+        # guarda o nome de cada transação e `_valores` (um `array` de floats)
+        # guarda o valor correspondente na mesma posição.
+        self._tipos = []
+        self._valores = array("d")
+
+    def __len__(self):
+        """Retorna a quantidade de transações registradas."""
+        return len(self._tipos)
+
+    def __iter__(self):
+        """Percorre os pares (tipo, valor) sem montar uma lista intermediária."""
+        return zip(self._tipos, self._valores)
 
     @property
     def transacoes(self):
-        """Retorna a lista completa de transações."""
-        return self._transacoes
+        """Retorna a lista de pares (tipo, valor) com todas as transações."""
+        return list(zip(self._tipos, self._valores))
 
     def adicionar_transacao(self, transacao):
         """
         Adiciona uma nova transação ao histórico.
-        O método `__class__.__name__` obtém o nome da classe (ex: "Saque").
+        O atributo de classe `_TIPO`, definido por `Transacao`, guarda o nome
+        da transação (ex: "Saque").
         """
-        self._transacoes.append(
-            {
-                "tipo": transacao.__class__.__name__,
-                "valor": transacao.valor,
-            }
-        )
+        self._tipos.append(transacao._TIPO)
+        self._valores.append(transacao.valor)
 
 
 # --- CLASSES DE CONTA ---
 class Conta:
     """Classe base que define os atributos e métodos essenciais de uma conta bancária."""
+    __slots__ = ("_saldo", "_numero", "_agencia", "_cliente", "_historico")
+
     def __init__(self, numero, cliente):
         self._saldo = 0.0
         self._numero = numero
@@ -104,6 +163,8 @@ class Conta:
 
     # Propriedades (`@property`) fornecem acesso controlado aos atributos.
     # Elas permitem ler os valores, mas não modificá-los diretamente de fora da classe.
+    # Dentro deste módulo, os caminhos mais usados leem os atributos protegidos
+    # diretamente para evitar o custo da chamada à propriedade.
     @property
     def saldo(self):
         return self._saldo
@@ -126,14 +187,14 @@ class Conta:
 
     def sacar(self, valor):
         """Valida e executa a operação de saque, se houver saldo suficiente."""
-        if valor > self.saldo:
-            print("\n@@@ Operação falhou! Saldo insuficiente. @@@")
+        if valor > self._saldo:
+            exibir_mensagem(MSG_SALDO_INSUFICIENTE)
         elif valor > 0:
             self._saldo -= valor
-            print("\n=== Saque realizado com sucesso! ===")
+            exibir_mensagem(MSG_SAQUE_OK)
             return True
         else:
-            print("\n@@@ Operação falhou! O valor informado é inválido. @@@")
+            exibir_mensagem(MSG_VALOR_INVALIDO)
         
         return False
 
@@ -141,10 +202,10 @@ class Conta:
         """Valida e executa a operação de depósito."""
         if valor > 0:
             self._saldo += valor
-            print("\n=== Depósito realizado com sucesso! ===")
+            exibir_mensagem(MSG_DEPOSITO_OK)
             return True
         else:
-            print("\n@@@ Operação falhou! O valor informado é inválido. @@@")
+            exibir_mensagem(MSG_VALOR_INVALIDO)
             return False
 
 class ContaCorrente(Conta):
@@ -152,11 +213,17 @@ class ContaCorrente(Conta):
     Classe especializada que herda de `Conta` e adiciona regras
     específicas para contas correntes, como limites de valor e quantidade de saques.
     """
+    # Apenas os atributos novos; os herdados de `Conta` já estão em seus slots.
+    __slots__ = ("_limite", "_limite_saques", "_numero_saques", "_msg_limite")
+
     def __init__(self, numero, cliente, limite=500, limite_saques=3):
         super().__init__(numero, cliente) # Inicializa os atributos da classe mãe (Conta).
         self._limite = limite
         self._limite_saques = limite_saques
         self._numero_saques = 0
+        # O limite não muda após a criação da conta, então a mensagem de
+        # limite excedido é formatada uma única vez.
+        self._msg_limite = f"@@@ Operação falhou! O valor do saque excede o limite de R$ {limite:.2f}. @@@"
 
     def sacar(self, valor):
         """
@@ -164,9 +231,9 @@ class ContaCorrente(Conta):
         as validações de limite por saque e quantidade de saques diários.
         """
         if valor > self._limite:
-            print(f"\n@@@ Operação falhou! O valor do saque excede o limite de R$ {self._limite:.2f}. @@@")
+            exibir_mensagem(self._msg_limite)
         elif self._numero_saques >= self._limite_saques:
-            print("\n@@@ Operação falhou! Número máximo de saques excedido. @@@")
+            exibir_mensagem(MSG_SAQUES_EXCEDIDOS)
         else:
             # Se as validações específicas passarem, chama a lógica de saque da classe mãe.
             if super().sacar(valor):
@@ -181,15 +248,17 @@ class ContaCorrente(Conta):
         pela função `print()` ou `str()`, facilitando a exibição dos dados da conta.
         """
         return f"""\
-Agência:\t{self.agencia}
-C/C:\t\t{self.numero}
-Titular:\t{self.cliente.nome}
+Agência:\t{self._agencia}
+C/C:\t\t{self._numero}
+Titular:\t{self._cliente.nome}
 """
 
 
 # --- CLASSES DE CLIENTE ---
 class Cliente:
     """Classe que gerencia os dados e as contas de um cliente."""
+    __slots__ = ("endereco", "contas")
+
     def __init__(self, endereco):
         self.endereco = endereco
         self.contas = [] # Um cliente pode possuir múltiplas contas.
@@ -207,6 +276,8 @@ class PessoaFisica(Cliente):
     Classe especializada que herda de `Cliente` e adiciona
     atributos específicos de uma pessoa física.
     """
+    __slots__ = ("nome", "data_nascimento", "cpf")
+
     def __init__(self, nome, data_nascimento, cpf, endereco):
         super().__init__(endereco) # Inicializa os atributos da classe mãe (Cliente).
         self.nome = nome
@@ -233,14 +304,13 @@ def menu():
     return input(menu_texto).lower() # Converte a entrada para minúscula.
 
 def filtrar_cliente(cpf, clientes):
-    """Busca um cliente na lista de clientes a partir do CPF."""
-    clientes_filtrados = [c for c in clientes if c.cpf == cpf]
-    return clientes_filtrados[0] if clientes_filtrados else None
+    """Busca um cliente no dicionário de clientes (indexado por CPF)."""
+    return clientes.get(cpf)
 
 def recuperar_conta_cliente(cliente):
     """Retorna a primeira conta de um cliente. (Pode ser estendido para múltiplas contas)."""
     if not cliente.contas:
-        print("\n@@@ Cliente não possui conta! @@@")
+        exibir_mensagem(MSG_CLIENTE_SEM_CONTA)
         return None
     return cliente.contas[0]
 
@@ -249,7 +319,7 @@ def depositar(clientes):
     cpf = input("Informe o CPF do cliente: ")
     cliente = filtrar_cliente(cpf, clientes)
     if not cliente:
-        print("\n@@@ Cliente não encontrado! @@@")
+        exibir_mensagem(MSG_CLIENTE_NAO_ENCONTRADO)
         return
 
     try:
@@ -259,14 +329,14 @@ def depositar(clientes):
         if conta:
             cliente.realizar_transacao(conta, transacao)
     except ValueError:
-        print("\n@@@ Valor inválido! Por favor, informe um número. @@@")
+        exibir_mensagem(MSG_ENTRADA_INVALIDA)
 
 def sacar(clientes):
     """Orquestra a operação de saque."""
     cpf = input("Informe o CPF do cliente: ")
     cliente = filtrar_cliente(cpf, clientes)
     if not cliente:
-        print("\n@@@ Cliente não encontrado! @@@")
+        exibir_mensagem(MSG_CLIENTE_NAO_ENCONTRADO)
         return
 
     try:
@@ -276,36 +346,42 @@ def sacar(clientes):
         if conta:
             cliente.realizar_transacao(conta, transacao)
     except ValueError:
-        print("\n@@@ Valor inválido! Por favor, informe um número. @@@")
+        exibir_mensagem(MSG_ENTRADA_INVALIDA)
 
 def exibir_extrato(clientes):
     """Orquestra a exibição do extrato de uma conta."""
     cpf = input("Informe o CPF do cliente: ")
     cliente = filtrar_cliente(cpf, clientes)
     if not cliente:
-        print("\n@@@ Cliente não encontrado! @@@")
+        exibir_mensagem(MSG_CLIENTE_NAO_ENCONTRADO)
         return
 
     conta = recuperar_conta_cliente(cliente)
     if not conta:
         return
 
-    print("\n================ EXTRATO ================")
-    transacoes = conta.historico.transacoes
-    if not transacoes:
-        print("Não foram realizadas movimentações.")
+    # O extrato é montado em uma única string e escrito de uma só vez,
+    # evitando uma chamada a `print()` para cada transação.
+    historico = conta._historico
+    if not historico:
+        movimentacoes = "Não foram realizadas movimentações."
     else:
-        for transacao in transacoes:
-            print(f"{transacao['tipo']}:\t\tR$ {transacao['valor']:.2f}")
+        movimentacoes = "\n".join(
+            f"{tipo}:\t\tR$ {valor:.2f}" for tipo, valor in historico
+        )
 
-    print(f"\nSaldo:\t\tR$ {conta.saldo:.2f}")
-    print("==========================================")
+    sys.stdout.write(
+        "\n================ EXTRATO ================\n"
+        f"{movimentacoes}\n"
+        f"\nSaldo:\t\tR$ {conta._saldo:.2f}\n"
+        "==========================================\n"
+    )
 
 def criar_cliente(clientes):
     """Orquestra a criação de um novo cliente (PessoaFisica)."""
     cpf = input("Informe o CPF (somente números): ")
-    if filtrar_cliente(cpf, clientes):
-        print("\n@@@ Já existe um cliente com esse CPF! @@@")
+    if cpf in clientes:
+        exibir_mensagem(MSG_CPF_EXISTENTE)
         return
 
     nome = input("Informe o nome completo: ")
@@ -313,60 +389,63 @@ def criar_cliente(clientes):
     endereco = input("Informe o endereço (logradouro, nro - bairro - cidade/sigla estado): ")
 
     novo_cliente = PessoaFisica(nome=nome, data_nascimento=data_nascimento, cpf=cpf, endereco=endereco)
-    clientes.append(novo_cliente)
-    print("\n=== Cliente criado com sucesso! ===")
+    clientes[cpf] = novo_cliente
+    exibir_mensagem(MSG_CLIENTE_CRIADO)
 
 def criar_conta(numero_conta, clientes, contas):
     """Orquestra a criação de uma nova conta corrente para um cliente existente."""
     cpf = input("Informe o CPF do cliente: ")
     cliente = filtrar_cliente(cpf, clientes)
     if not cliente:
-        print("\n@@@ Cliente não encontrado, criação de conta encerrada! @@@")
+        exibir_mensagem(MSG_CONTA_NAO_CRIADA)
         return
 
     conta = ContaCorrente.nova_conta(cliente=cliente, numero=numero_conta)
     contas.append(conta)
     cliente.adicionar_conta(conta)
-    print("\n=== Conta criada com sucesso! ===")
+    exibir_mensagem(MSG_CONTA_CRIADA)
 
 def listar_contas(contas):
     """Exibe os dados de todas as contas cadastradas."""
     if not contas:
-        print("\n@@@ Nenhuma conta cadastrada. @@@")
+        exibir_mensagem(MSG_SEM_CONTAS)
         return
         
-    for conta in contas:
-        print("=" * 100)
-        print(str(conta))
+    separador = "=" * 100
+    sys.stdout.write("".join(f"{separador}\n{conta}\n" for conta in contas))
+
+# Operações do menu que recebem apenas o dicionário de clientes.
+# `main()` consulta este dicionário em vez de percorrer uma cadeia de `if/elif`.
+OPERACOES = {
+    "d": depositar,
+    "s": sacar,
+    "e": exibir_extrato,
+    "nu": criar_cliente,
+}
 
 # --- FUNÇÃO PRINCIPAL ---
 def main():
     """Função principal que inicializa o sistema e gerencia o loop de operações."""
-    clientes = []
+    clientes = {} # Dicionário de clientes indexado pelo CPF.
     contas = []
 
     # Loop infinito que mantém o programa em execução até o usuário decidir sair.
     while True:
         opcao = menu()
 
-        if opcao == "d":
-            depositar(clientes)
-        elif opcao == "s":
-            sacar(clientes)
-        elif opcao == "e":
-            exibir_extrato(clientes)
-        elif opcao == "nu":
-            criar_cliente(clientes)
+        operacao = OPERACOES.get(opcao)
+        if operacao:
+            operacao(clientes)
         elif opcao == "nc":
             numero_conta = len(contas) + 1
             criar_conta(numero_conta, clientes, contas)
         elif opcao == "lc":
             listar_contas(contas)
         elif opcao == "q":
-            print("\nObrigado por utilizar nosso sistema. Até logo!\n")
+            exibir_mensagem(MSG_ENCERRAMENTO)
             break
         else:
-            print("\n@@@ Operação inválida, por favor selecione novamente a operação desejada. @@@")
+            exibir_mensagem(MSG_OPERACAO_INVALIDA)
 
 
 # --- PONTO DE ENTRADA DO PROGRAMA ---